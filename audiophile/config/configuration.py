@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     """
 
     FILE_PATH: str = "audiophile/utils/media"
+    MEDIA_STORAGE: str = "local"
+    MEDIA_PREFETCH_DEPTH: int = 4
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_REGION: str = ""
@@ -1,7 +1,8 @@
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import Depends, FastAPI, File, UploadFile
+from fastapi import Depends, FastAPI, File, Query, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from audiophile.config.database import SessionLocal, engine
@@ -10,6 +11,7 @@ from . import models, schema, workers
 from .config.configuration import settings
 from .services.buckets import S3Service
 from .tasks import generate_predictions
+from .utils.helpers import files_to_columns
 
 models.Base.metadata.create_all(bind=engine)
 
@@ -65,6 +67,23 @@ def local_upload(file: UploadFile = File(...)):
     return response
 
 
+@app.get(
+    "/api/files/batch/",
+    response_model=Union[List[schema.BatchFile], schema.ColumnarFiles],
+)
+def get_files_batch(
+    ids: List[int] = Query(...),
+    model: Optional[str] = None,
+    columnar: bool = False,
+    db: Session = Depends(get_db),
+) -> Any:
+    """Get details and latest predictions for several files at once"""
+    files = workers.get_files_by_ids(db, ids, model)
+    if columnar:
+        return JSONResponse(files_to_columns(files))
+    return files
+
+
 @app.get("/api/files/{file_id}/", response_model=schema.File)
 def get_file_details(file_id: int, db: Session = Depends(get_db)) -> Any:
     """Get detail for a given file_id"""
@@ -20,3 +20,26 @@ class File(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class BatchFile(File):
+    id: int
+
+
+class FileColumns(BaseModel):
+    id: List[int]
+    file: List[str]
+    duration: List[int]
+
+
+class PredictionColumns(BaseModel):
+    file_id: List[int]
+    utterance: List[str]
+    time: List[int]
+    confidence: List[float]
+    model: List[str]
+
+
+class ColumnarFiles(BaseModel):
+    files: FileColumns
+    predictions: PredictionColumns
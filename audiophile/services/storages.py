@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import AsyncIterator, Iterable, List, Tuple, Union
+
+import aiofiles
+from aiobotocore.session import get_session
+
+from audiophile.config.configuration import settings
+
+logger = logging.getLogger(__name__)
+
+S3_MEDIA_PREFIX = "storages/"
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class LocalStorage:
+    """Media storage backed by a directory on the local disk"""
+
+    def __init__(self, *, root, chunk_size=READ_CHUNK_SIZE):
+        self.root = root
+        self.chunk_size = chunk_size
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def list_files(self, suffix: str = ".wav") -> List[str]:
+        """List the keys of all media files in the storage
+
+        Args:
+            suffix: Only keys ending with this suffix are returned
+
+        Returns:
+            A list of file paths relative to the storage root
+        """
+        keys = []
+        for root, dirs, files in os.walk(self.root):
+            for file in files:
+                if file.endswith(suffix):
+                    keys.append(os.path.relpath(os.path.join(root, file), self.root))
+        return sorted(keys)
+
+    async def read_file(self, key: str) -> bytes:
+        """Read the content of a media file in chunks
+
+        Args:
+            key: The path of the file relative to the storage root
+
+        Returns:
+            The raw bytes of the file
+        """
+        buffer = bytearray()
+        async with aiofiles.open(os.path.join(self.root, key), "rb") as f:
+            while chunk := await f.read(self.chunk_size):
+                buffer.extend(chunk)
+        return bytes(buffer)
+
+
+class S3Storage:
+    """Media storage backed by an s3 bucket. Must be used as an async context
+    manager so a single client is shared by all requests made during a run"""
+
+    def __init__(
+        self,
+        *,
+        bucket_name,
+        region_name,
+        access_key,
+        secret_key,
+        prefix=S3_MEDIA_PREFIX,
+        chunk_size=READ_CHUNK_SIZE,
+    ):
+        self.bucket_name = bucket_name
+        self.region_name = region_name
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.prefix = prefix
+        self.chunk_size = chunk_size
+        self._client_context = None
+        self._client = None
+
+    async def __aenter__(self):
+        self._client_context = get_session().create_client(
+            "s3",
+            region_name=self.region_name,
+            aws_access_key_id=self.access_key,
+            aws_secret_access_key=self.secret_key,
+        )
+        self._client = await self._client_context.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client_context.__aexit__(*exc_info)
+        self._client_context = None
+        self._client = None
+
+    async def list_files(self, suffix: str = ".wav") -> List[str]:
+        """List the keys of all media files in the bucket under the prefix
+
+        Args:
+            suffix: Only keys ending with this suffix are returned
+
+        Returns:
+            A list of object keys
+        """
+        keys = []
+        paginator = self._client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=self.prefix
+        ):
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith(suffix):
+                    keys.append(obj["Key"])
+        return keys
+
+    async def read_file(self, key: str) -> bytes:
+        """Stream the content of an object in chunks, without writing it to disk
+
+        Args:
+            key: The key of the object in the bucket
+
+        Returns:
+            The raw bytes of the object
+        """
+        response = await self._client.get_object(Bucket=self.bucket_name, Key=key)
+        buffer = bytearray()
+        async with response["Body"] as stream:
+            while chunk := await stream.read(self.chunk_size):
+                buffer.extend(chunk)
+        return bytes(buffer)
+
+
+def get_storage() -> Union[LocalStorage, S3Storage]:
+    """Build the media storage selected by the MEDIA_STORAGE setting
+
+    Returns:
+        A storage instance to list and read media files from
+
+    Raises:
+        ValueError: If MEDIA_STORAGE is not a supported storage
+    """
+    if settings.MEDIA_STORAGE == "local":
+        return LocalStorage(root=settings.FILE_PATH)
+    if settings.MEDIA_STORAGE == "s3":
+        return S3Storage(
+            bucket_name=settings.AWS_S3_BUCKET,
+            region_name=settings.AWS_REGION,
+            access_key=settings.AWS_ACCESS_KEY_ID,
+            secret_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+    raise ValueError(f"Media storage {settings.MEDIA_STORAGE} not supported")
+
+
+async def prefetch_files(
+    storage: Union[LocalStorage, S3Storage], keys: Iterable[str], depth: int
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """Read files from a storage in order, keeping up to `depth` reads in flight
+    so the next files are downloading while the current one is being consumed
+
+    Args:
+        storage: The storage to read the files from
+        keys: The keys of the files to be read
+        depth: The maximum number of files being read concurrently
+
+    Yields:
+        A tuple containing the key of the file and its raw bytes
+    """
+    keys = iter(keys)
+    pending = deque()
+
+    def schedule_next():
+        key = next(keys, None)
+        if key is not None:
+            pending.append((key, asyncio.ensure_future(storage.read_file(key))))
+
+    for _ in range(max(depth, 1)):
+        schedule_next()
+    try:
+        while pending:
+            key, task = pending.popleft()
+            data = await task
+            schedule_next()
+            yield key, data
+    finally:
+        for _, task in pending:
+            task.cancel()
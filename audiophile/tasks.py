@@ -1,46 +1,72 @@
+import asyncio
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Query, Session
 
 from audiophile import models, workers
+from audiophile.config.configuration import settings
 from audiophile.config.database import SessionLocal
+from audiophile.services.storages import get_storage, prefetch_files
 from audiophile.utils import helpers
 from audiophile.utils.constants import keywords as phrases
 
 
 def generate_predictions():
-    with SessionLocal() as db:
-        audio_files_path = f"{os.getcwd()}/audiophile/utils/media/"
+    asyncio.run(_generate_predictions())
+
+
+async def _generate_predictions():
+    loop = asyncio.get_running_loop()
+    # Inference and database writes run on a single worker thread so the event
+    # loop stays free to prefetch the next files from the storage meanwhile
+    with SessionLocal() as db, ThreadPoolExecutor(max_workers=1) as executor:
         existing_predictions = db.query(models.Prediction)
         print(
             f"Started running task. Current total number of predictions: {existing_predictions.count()}"
         )
         corrupt_predictions = []
-        for root, dirs, files in os.walk(audio_files_path):
-            for file in files:
-                if file.endswith(".wav"):
-                    file_path = os.path.join(root, file)
-                    file_name = file.split(".")[0]
-                    file_duration = helpers.get_file_duration(file_path)
-                    file_obj, _ = workers.get_or_create_file(
-                        file=file_name, duration=file_duration, db=db
-                    )
-                    reference = helpers.generate_unique_reference_id()
-                    for phrase in phrases:
-                        file_predictions = workers.generate_phrase_detections(
-                            phrase, file
-                        )
-                        file_predictions = [data.__dict__ for data in file_predictions]
-                        if helpers.does_data_drift_exist(
-                            existing_predictions, file_predictions
-                        ):
-                            # At this point, we could choose to email an admin or decide to not
-                            # add this set of predictions to our existing predictions
-                            corrupt_predictions.extend(file_predictions)
-                        for prediction in file_predictions:
-                            prediction["reference"] = reference
-                            workers.create_prediction(
-                                db=db, file_id=file_obj.id, **prediction
-                            )
-                    workers.update_file(db=db, file_id=file_obj.id, reference=reference)
+        async with get_storage() as storage:
+            keys = await storage.list_files(".wav")
+            async for key, data in prefetch_files(
+                storage, keys, settings.MEDIA_PREFETCH_DEPTH
+            ):
+                await loop.run_in_executor(
+                    executor,
+                    _generate_file_predictions,
+                    db,
+                    existing_predictions,
+                    corrupt_predictions,
+                    key,
+                    data,
+                )
         print(
             f"Finished running task. Current total number of predictions: {db.query(models.Prediction).count()}"
         )
+
+
+def _generate_file_predictions(
+    db: Session,
+    existing_predictions: Query,
+    corrupt_predictions: list,
+    key: str,
+    data: bytes,
+):
+    file_name = os.path.basename(key).split(".")[0]
+    file_duration = helpers.get_file_duration(io.BytesIO(data))
+    file_obj, _ = workers.get_or_create_file(
+        file=file_name, duration=file_duration, db=db
+    )
+    reference = helpers.generate_unique_reference_id()
+    for phrase in phrases:
+        file_predictions = workers.generate_phrase_detections(phrase, io.BytesIO(data))
+        file_predictions = [prediction.__dict__ for prediction in file_predictions]
+        if helpers.does_data_drift_exist(existing_predictions, file_predictions):
+            # At this point, we could choose to email an admin or decide to not
+            # add this set of predictions to our existing predictions
+            corrupt_predictions.extend(file_predictions)
+        for prediction in file_predictions:
+            prediction["reference"] = reference
+            workers.create_prediction(db=db, file_id=file_obj.id, **prediction)
+    workers.update_file(db=db, file_id=file_obj.id, reference=reference)
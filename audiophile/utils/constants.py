@@ -2,5 +2,6 @@ from audiophile.datasets.models import inference_models  # noqa
 
 MODEL_CONFIDENCE_THRESHOLD = 0.9
 SAMPLE_RATE = 8000
+MAX_BATCH_FILES = 500
 
 keywords = ["call", "is", "recorded"]
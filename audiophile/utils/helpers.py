@@ -1,7 +1,8 @@
 import json
+import os
 import uuid
 import wave
-from typing import Dict, Iterator, List, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Tuple, Union
 
 import pandas as pd
 import requests
@@ -14,13 +15,17 @@ from sqlalchemy.orm import Query
 from torchaudio import transforms
 
 from audiophile import models
+from audiophile.config.configuration import settings
 
 
-def load_resampled(audio_loc: str, resample_rate: int = 8000) -> torch.tensor:
+def load_resampled(
+    audio_loc: Union[str, BinaryIO], resample_rate: int = 8000
+) -> torch.tensor:
     """Load and resample an audio file
 
     Args:
-        audio_loc: Full or relative path to the audio file
+        audio_loc: Path to the audio file relative to the media directory, or a
+            file-like object containing the audio data
         resample_rate: What sampling rate should the audio file be resampled
             to. Defaults to 8000
 
@@ -30,8 +35,10 @@ def load_resampled(audio_loc: str, resample_rate: int = 8000) -> torch.tensor:
     Raises:
         FileNotFoundError: If the audio_loc is not a valid audio file
     """
+    if isinstance(audio_loc, str):
+        audio_loc = os.path.join(settings.FILE_PATH, audio_loc)
     try:
-        audio, rate = torchaudio.load(f"audiophile/utils/media/{audio_loc}")
+        audio, rate = torchaudio.load(audio_loc)
     except RuntimeError as e:
         raise FileNotFoundError(e)
 
@@ -58,11 +65,12 @@ def iterate_call(
         yield start_idx, audio[:, start_idx : start_idx + window]  # noqa: E203
 
 
-def get_file_duration(audio_loc: str) -> float:
+def get_file_duration(audio_loc: Union[str, BinaryIO]) -> float:
     """Get the duration of an audio file
 
     Args:
-        audio_loc: Full or relative path to the audio file
+        audio_loc: Full or relative path to the audio file, or a file-like
+            object containing the audio data
 
     Returns:
         The duration of the audio file in seconds
@@ -126,3 +134,32 @@ def does_data_drift_exist(
     if drift_data["data_drift"]["data"]["metrics"]["confidence"]["drift_detected"]:
         return True
     return False
+
+
+def files_to_columns(files: List[Dict]) -> Dict[str, Dict[str, List]]:
+    """Convert a list of file details into a columnar representation, where each
+    field is a list of values instead of being repeated on every object
+
+    Args:
+        files: File details as returned by workers.get_files_by_ids
+
+    Returns:
+        A dictionary with a column per field for the files and for their
+            predictions. Predictions reference their file through file_id
+    """
+    file_columns = {"id": [], "file": [], "duration": []}
+    prediction_columns = {
+        "file_id": [],
+        "utterance": [],
+        "time": [],
+        "confidence": [],
+        "model": [],
+    }
+    for file in files:
+        for key, column in file_columns.items():
+            column.append(file[key])
+        for prediction in file["confidences"]:
+            prediction_columns["file_id"].append(file["id"])
+            for key in ("utterance", "time", "confidence", "model"):
+                prediction_columns[key].append(prediction[key])
+    return {"files": file_columns, "predictions": prediction_columns}
@@ -1,11 +1,12 @@
-from typing import List, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from . import models, schema
 from .services.buckets import S3Service
-from .utils.constants import MODEL_CONFIDENCE_THRESHOLD, SAMPLE_RATE, inference_models, keywords
+from .utils.constants import MAX_BATCH_FILES, MODEL_CONFIDENCE_THRESHOLD, SAMPLE_RATE, inference_models, keywords
 from .utils.helpers import iterate_call, load_resampled
 
 
@@ -80,6 +81,71 @@ def get_file_prediction_filtered_by_model(
     return file
 
 
+def get_files_by_ids(
+    db: Session, file_ids: List[int], model: Optional[str] = None
+) -> List[Dict]:
+    """Get the details and latest predictions for several files with a single query
+
+    Args:
+        db: SQLAlchemy session object
+        file_ids: The ids of the files for which predictions are to be retrieved
+        model: An optional model to filter the predictions by
+
+    Returns:
+        A list of file details, in the order of file_ids. Ids not found in the
+            database are left out
+    """
+    file_ids = list(dict.fromkeys(file_ids))
+    if len(file_ids) > MAX_BATCH_FILES:
+        raise HTTPException(
+            400, f"At most {MAX_BATCH_FILES} files can be requested at once"
+        )
+    prediction_filter = and_(
+        models.Prediction.file_id == models.File.id,
+        models.Prediction.reference == models.File.reference,
+    )
+    if model is not None:
+        allowed_models = [model.__class__.__name__ for model in inference_models]
+        if model not in allowed_models:
+            raise HTTPException(400, f"Model {model} not supported")
+        prediction_filter = and_(prediction_filter, models.Prediction.model == model)
+    rows = (
+        db.query(
+            models.File.id,
+            models.File.file,
+            models.File.duration,
+            models.Prediction.utterance,
+            models.Prediction.time,
+            models.Prediction.confidence,
+            models.Prediction.model,
+        )
+        .outerjoin(models.Prediction, prediction_filter)
+        .filter(models.File.id.in_(file_ids))
+        .order_by(models.Prediction.id)
+        .all()
+    )
+
+    files = {}
+    for file_id, file, duration, utterance, time, confidence, model_name in rows:
+        if file_id not in files:
+            files[file_id] = {
+                "id": file_id,
+                "file": file,
+                "duration": duration,
+                "confidences": [],
+            }
+        if utterance is not None:
+            files[file_id]["confidences"].append(
+                {
+                    "utterance": utterance,
+                    "time": time,
+                    "confidence": confidence,
+                    "model": model_name,
+                }
+            )
+    return [files[file_id] for file_id in file_ids if file_id in files]
+
+
 def get_files(db: Session) -> List[schema.File]:
     """Get all files in the database
 
@@ -198,15 +264,15 @@ def create_prediction(
 
 
 def generate_phrase_detections(
-    utterance: str, audio_loc: str
+    utterance: str, audio_loc: Union[str, BinaryIO]
 ) -> List[models.Prediction]:
     """Run inference on an audio file with a model for an utterance. Currently
     available utterances are: "call", "is", "recorded"
 
     Args:
         utterance: Case sensitive name of the model to be used for inference
-        audio_loc: The full or relative path to the audio file for which inference
-            is to be executed
+        audio_loc: The path to the audio file relative to the media directory, or a
+            file-like object containing the audio data for which inference is to be executed
     """
     if utterance not in keywords:
         raise HTTPException(